@@ -1,6 +1,11 @@
 # flake8: noqa: F401
 
 
-from .base import AssistantRegister, ChatAssistant, ProactiveChatAssistant
+from .base import (
+    AssistantRegister,
+    ChatAssistant,
+    ProactiveChatAssistant,
+    prime_assistants,
+)
 from .coach import ConversationDesigner
 from .resume_writer import ResumeBioWriter, ResumeExperienceWriter
@@ -1,10 +1,13 @@
-from typing import ClassVar, MutableMapping, Type
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, ClassVar, Iterable, MutableMapping, Type
 
 import attrs
-from haystack.nodes import PromptNode
 from loguru import logger
 
-from ronin.prompts.defaults import DEFAULT_PROACTIVE_MESSAGE_TRIGGER
+from ronin.prompts import defaults
 from ronin.prompts.templates import (
     AssistantMessageTemplate,
     SystemPromptTemplate,
@@ -12,6 +15,10 @@ from ronin.prompts.templates import (
 )
 from ronin.typing_mixin import ChatMessage
 
+# The PromptNode is only used as an annotation, don't import Haystack for it
+if TYPE_CHECKING:
+    from haystack.nodes import PromptNode
+
 
 class AssistantRegister:
     """Implements the Register pattern for assistants.
@@ -28,22 +35,23 @@ class AssistantRegister:
     ```
     """
 
-    _registry: ClassVar[MutableMapping[str, Type["ChatAssistant"]]] = dict()
+    _registry: ClassVar[MutableMapping[str, Type[ChatAssistant]]] = dict()
 
     @classmethod
     def register(cls, name: str):
         """Decorator for registering assistants."""
 
-        def _register(assistant_class: Type["ChatAssistant"]):
+        def _register(assistant_class: Type[ChatAssistant]):
             cls._registry[name] = assistant_class
             return assistant_class
 
         return _register
 
     @classmethod
-    def get(cls, name: str) -> Type["ChatAssistant"]:
+    def get(cls, name: str) -> Type[ChatAssistant]:
         """Retrieve an Assistant's class from its name."""
-        if name not in cls._registry:
+        assistant_class = cls._registry.get(name)
+        if assistant_class is None:
             error_msg = (
                 f"Could not find assistant registered with name '{name}'. "
                 f"Available are: {list(cls._registry.keys())}"
@@ -51,7 +59,7 @@ class AssistantRegister:
             logger.error(error_msg)
             raise KeyError(error_msg)
 
-        return cls._registry[name]
+        return assistant_class
 
 
 # XXX: It would be nice to have this be a Haystack Node.
@@ -80,17 +88,21 @@ class ChatAssistant:
     auto_prime : bool, optional
         Whether to prime the assistant to a certain state when the assistant is
         instantiated.
-    history : list[ChatMessage]
+    history_max_length : int, optional
+        Maximum number of messages kept in the chat history. Older messages are
+        discarded as new ones arrive. By default, the history is unbounded.
+    history : deque[ChatMessage]
         The chat history.
     """
 
     chat_node: PromptNode
     chat_system_prompt: SystemPromptTemplate
+    # Default templates are looked up on instantiation, as they are built lazily
     chat_user_prompt: UserMessageTemplate = attrs.field(
-        factory=UserMessageTemplate.with_dummy_template, repr=False
+        factory=lambda: defaults.DEFAULT_USER_MESSAGE_TEMPLATE, repr=False
     )
     chat_assistant_prompt: AssistantMessageTemplate = attrs.field(
-        factory=AssistantMessageTemplate.with_dummy_template, repr=False
+        factory=lambda: defaults.DEFAULT_ASSISTANT_MESSAGE_TEMPLATE, repr=False
     )
 
     chat_system_kwargs: dict = attrs.field(factory=dict, repr=False)
@@ -98,7 +110,14 @@ class ChatAssistant:
     priming_message: str | None = None
     auto_prime: bool = False
 
-    history: list[ChatMessage] = attrs.field(factory=list, repr=False, init=False)
+    history_max_length: int | None = attrs.field(default=None, repr=False)
+    history: deque[ChatMessage] = attrs.field(
+        default=attrs.Factory(
+            lambda self: deque(maxlen=self.history_max_length), takes_self=True
+        ),
+        repr=False,
+        init=False,
+    )
 
     def __attrs_post_init__(self):
         if self.auto_prime and self.priming_message:
@@ -110,61 +129,146 @@ class ChatAssistant:
 
     def build_user_chat_message(self, message: str, **kwargs) -> ChatMessage:
         """Build the user's chat message."""
-        params = kwargs
-        params[self.chat_user_prompt.message_prompt_parameter] = message
-        return self.chat_user_prompt.fill(**params)
+        prompt = self.chat_user_prompt
+        return prompt.fill(**{**kwargs, prompt.message_prompt_parameter: message})
 
     def build_assistant_chat_message(self, message: str, **kwargs) -> ChatMessage:
         """Build the assistant's chat message."""
-        params = kwargs
-        params[self.chat_assistant_prompt.message_prompt_parameter] = message
-        return self.chat_assistant_prompt.fill(**params)
+        prompt = self.chat_assistant_prompt
+        return prompt.fill(**{**kwargs, prompt.message_prompt_parameter: message})
 
     def prime(self) -> ChatMessage:
         """Prime the assistant to a certain state."""
+        prime_response = self._chat(messages=self._build_priming_messages())
+        logger.debug("Prime response: {}", prime_response)
+        return prime_response
+
+    async def aprime(self) -> ChatMessage:
+        """Prime the assistant to a certain state without blocking the event loop.
+
+        Use `prime_assistants` to prime several assistants concurrently.
+        """
+        prime_response = await self._achat(messages=self._build_priming_messages())
+        logger.debug("Prime response: {}", prime_response)
+        return prime_response
+
+    def _build_priming_messages(self) -> list[ChatMessage]:
         logger.debug("Priming assistant to helpful state.")
-        messages = [
+        return [
             # XXX: Should priming happen with or without the system message?
-            self.build_chat_system_message(),
+            self.build_chat_system_message(**self.chat_system_kwargs),
             UserMessageTemplate.from_str(prompt=self.priming_message).fill(),
         ]
 
-        prime_response = self._chat(messages=messages)
-        logger.debug(f"Prime response: {prime_response}")
-        return prime_response
-
     def chat(
         self,
         message: str,
-        user_message_kwargs: dict = dict(),
-        system_message_kwargs: dict = dict(),
+        user_message_kwargs: dict | None = None,
+        system_message_kwargs: dict | None = None,
+        chat_node_kwargs: dict | None = None,
     ) -> ChatMessage:
-        """Chat with the assistant."""
+        """Chat with the assistant.
+
+        Parameters
+        ----------
+        message : str
+            The user's message.
+        user_message_kwargs : dict, optional
+            Keyword arguments passed to the user's chat message template.
+        system_message_kwargs : dict, optional
+            Keyword arguments passed to the system's chat message template.
+            By default, `chat_system_kwargs` is used.
+        chat_node_kwargs : dict, optional
+            Keyword arguments passed to the `chat_node` call, e.g. a `stream_handler`
+            to stream the answer's tokens as they are generated.
+        """
+        messages = self._build_chat_messages(
+            message=message,
+            user_message_kwargs=user_message_kwargs,
+            system_message_kwargs=system_message_kwargs,
+        )
+        return self._chat(messages=messages, chat_node_kwargs=chat_node_kwargs)
 
-        if not system_message_kwargs:
-            system_message_kwargs = self.chat_system_kwargs
+    async def achat(
+        self,
+        message: str,
+        user_message_kwargs: dict | None = None,
+        system_message_kwargs: dict | None = None,
+        chat_node_kwargs: dict | None = None,
+    ) -> ChatMessage:
+        """Chat with the assistant without blocking the event loop.
+
+        Refer to `chat` for the parameters' description.
+        """
+        messages = self._build_chat_messages(
+            message=message,
+            user_message_kwargs=user_message_kwargs,
+            system_message_kwargs=system_message_kwargs,
+        )
+        return await self._achat(messages=messages, chat_node_kwargs=chat_node_kwargs)
+
+    def _build_chat_messages(
+        self,
+        message: str,
+        user_message_kwargs: dict | None = None,
+        system_message_kwargs: dict | None = None,
+    ) -> list[ChatMessage]:
+        """Add the user's message to the history and build the messages to send."""
+        if user_message_kwargs is None:
+            user_message_kwargs = {}
+
+        system_message = self.build_chat_system_message(
+            **(system_message_kwargs or self.chat_system_kwargs)
+        )
 
         user_message = self.build_user_chat_message(
             message=message, **user_message_kwargs
         )
 
         self.history.append(user_message)
-        messages = [
-            self.build_chat_system_message(**system_message_kwargs)
-        ] + self.history
+        return [system_message, *self.history]
 
-        return self._chat(messages=messages)
+    def _chat(
+        self, messages: list[ChatMessage], chat_node_kwargs: dict | None = None
+    ) -> ChatMessage:
+        if chat_node_kwargs is None:
+            chat_node_kwargs = {}
 
-    def _chat(self, messages: list[ChatMessage]) -> ChatMessage:
         # XXX: Haystack does not support passing chat messages to the PromptNode.run
         # method, and thus we can't use the Pipeline class
-        answer = self.chat_node(messages)[0]
+        # NOTE: `messages` must be a list, Haystack's chat invocation layers reject
+        # any other sequence type (e.g. tuples) as chat messages.
+        answer = self.chat_node(messages, **chat_node_kwargs)[0]
+        return self._add_answer_to_history(answer)
+
+    async def _achat(
+        self, messages: list[ChatMessage], chat_node_kwargs: dict | None = None
+    ) -> ChatMessage:
+        if chat_node_kwargs is None:
+            chat_node_kwargs = {}
+
+        # XXX: PromptNode only exposes an asynchronous API through PromptNode.arun,
+        # which has the same limitation as PromptNode.run (see `_chat`). Instead, the
+        # blocking call runs in a worker thread, leaving the event loop free.
+        answers = await asyncio.to_thread(self.chat_node, messages, **chat_node_kwargs)
+        answer = answers[0]
+        return self._add_answer_to_history(answer)
 
+    def _add_answer_to_history(self, answer: str) -> ChatMessage:
         assistant_message = self.build_assistant_chat_message(message=answer)
         self.history.append(assistant_message)
         return assistant_message
 
 
+async def prime_assistants(assistants: Iterable[ChatAssistant]) -> list[ChatMessage]:
+    """Prime assistants concurrently, instead of one after the other.
+
+    Meant for assistants instantiated with `auto_prime=False`, as auto priming happens
+    sequentially while each assistant is instantiated.
+    """
+    return await asyncio.gather(*(assistant.aprime() for assistant in assistants))
+
+
 @AssistantRegister.register("base-proactive-assistant")
 @attrs.define(kw_only=True)
 class ProactiveChatAssistant(ChatAssistant):
@@ -176,14 +280,35 @@ class ProactiveChatAssistant(ChatAssistant):
         The message that triggers the assistant to proactively send a message.
     """
 
-    proactive_message_trigger: UserMessageTemplate = DEFAULT_PROACTIVE_MESSAGE_TRIGGER
+    proactive_message_trigger: UserMessageTemplate = attrs.field(
+        factory=lambda: defaults.DEFAULT_PROACTIVE_MESSAGE_TRIGGER
+    )
+
+    def proactively_send_message(
+        self, chat_node_kwargs: dict | None = None, **kwargs
+    ) -> ChatMessage:
+        """Proactively send a message to the user.
+
+        Keyword arguments are passed to the `proactive_message_trigger` template, while
+        `chat_node_kwargs` are passed to the `chat_node` call.
+        """
+        return self._chat(
+            messages=self._build_proactive_messages(**kwargs),
+            chat_node_kwargs=chat_node_kwargs,
+        )
 
-    def proactively_send_message(self, **kwargs) -> ChatMessage:
-        """Proactively send a message to the user."""
+    async def aproactively_send_message(
+        self, chat_node_kwargs: dict | None = None, **kwargs
+    ) -> ChatMessage:
+        """Proactively send a message to the user without blocking the event loop."""
+        return await self._achat(
+            messages=self._build_proactive_messages(**kwargs),
+            chat_node_kwargs=chat_node_kwargs,
+        )
+
+    def _build_proactive_messages(self, **kwargs) -> list[ChatMessage]:
         logger.debug("Assistant is proactively sending a message.")
-        messages = [
-            self.build_chat_system_message(),
+        return [
+            self.build_chat_system_message(**self.chat_system_kwargs),
             self.proactive_message_trigger.fill(**kwargs),
         ]
-
-        return self._chat(messages=messages)
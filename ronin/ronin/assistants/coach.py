@@ -3,6 +3,7 @@ import functools
 import attrs
 
 from ronin.assistants.base import AssistantRegister, ProactiveChatAssistant
+from ronin.prompts import defaults
 from ronin.prompts.templates import (
     AssistantMessageTemplate,
     SystemPromptTemplate,
@@ -10,38 +11,43 @@ from ronin.prompts.templates import (
 )
 
 
+@functools.cache
+def _conversation_designer_system_prompt() -> SystemPromptTemplate:
+    # Built once per process, on the first conversation designer
+    return SystemPromptTemplate.from_str(
+        prompt=(
+            "You are an experienced UX designer, specialized in designing "
+            "conversational experiences with virtual assistants. You have a "
+            "background in coaching and can design a virtual assistant that "
+            "helps people achieve their goals.\n"
+            "In this role, you are responsible for:\n"
+            "- Defining what information the user shall provide for briefing "
+            "the assistant;\n"
+            "- Proposing the assistant's personality;\n"
+            "- Designing the conversation flow;\n"
+            "- Proposing integrations with other systems;\n"
+            "You are conversing with a software engineer that will implement "
+            "the assistant along with any other integration you propose.\n"
+            "You have the creative freedom to challange the status quo and propose "
+            "new ideas, and to think of the best way to build the perfect "
+            "assistant."
+        ),
+    )
+
+
 @AssistantRegister.register("conversation-designer")
 @attrs.define
 class ConversationDesigner(ProactiveChatAssistant):
     """Conversation Designer assistant."""
 
     chat_system_prompt: SystemPromptTemplate = attrs.field(
-        factory=functools.partial(
-            SystemPromptTemplate.from_str,
-            prompt=(
-                "You are an experienced UX designer, specialized in designing "
-                "conversational experiences with virtual assistants. You have a "
-                "background in coaching and can design a virtual assistant that "
-                "helps people achieve their goals.\n"
-                "In this role, you are responsible for:\n"
-                "- Defining what information the user shall provide for briefing "
-                "the assistant;\n"
-                "- Proposing the assistant's personality;\n"
-                "- Designing the conversation flow;\n"
-                "- Proposing integrations with other systems;\n"
-                "You are conversing with a software engineer that will implement "
-                "the assistant along with any other integration you propose.\n"
-                "You have the creative freedom to challange the status quo and propose "
-                "new ideas, and to think of the best way to build the perfect "
-                "assistant."
-            ),
-        )
+        factory=_conversation_designer_system_prompt
     )
     chat_user_prompt: UserMessageTemplate = attrs.field(
-        factory=UserMessageTemplate.with_dummy_template, repr=False
+        factory=lambda: defaults.DEFAULT_USER_MESSAGE_TEMPLATE, repr=False
     )
     chat_assistant_prompt: AssistantMessageTemplate = attrs.field(
-        factory=AssistantMessageTemplate.with_dummy_template, repr=False
+        factory=lambda: defaults.DEFAULT_ASSISTANT_MESSAGE_TEMPLATE, repr=False
     )
 
     priming_message: str | None = (
@@ -1,13 +1,17 @@
+import inspect
 import json
+import sys
+from typing import TYPE_CHECKING, Iterable
 
 import click
-from haystack.nodes import PromptModel, PromptNode
 from loguru import logger
 
-from ronin.assistants import AssistantRegister, ProactiveChatAssistant
 from ronin.cli import coroutine
-from ronin.config import settings
-from ronin.prompts.templates import SystemPromptTemplate
+from ronin.config import get_settings
+from ronin.typing_mixin import ChatMessage
+
+if TYPE_CHECKING:
+    from ronin.assistants import ChatAssistant
 
 
 @click.command(name="chat", help="Chat with Ronin assistants.")
@@ -42,6 +46,19 @@ from ronin.prompts.templates import SystemPromptTemplate
     default=False,
     help="Whether to keep the conversation open or not.",
 )
+@click.option(
+    "--stream",
+    "-s",
+    is_flag=True,
+    default=False,
+    help="Whether to print the response's tokens as they are generated.",
+)
+@click.option(
+    "--socket-path",
+    envvar="RONIN_SOCKET",
+    help="UNIX socket of a `ronin serve` process to chat with, instead of starting "
+    "a new assistant. Defaults to $RONIN_SOCKET.",
+)
 @click.option(
     "--output-path",
     "-o",
@@ -53,16 +70,96 @@ async def chat(
     interactive: bool,
     system_message: str,
     max_length: int,
+    stream: bool,
+    socket_path: str | None,
     output_path: str,
 ):
+    chat_node_kwargs = {}
+    if socket_path:
+        from ronin.cli.serve import AssistantClient
+
+        logger.info(f"Connecting to assistant served at {socket_path}.")
+        assistant = await AssistantClient.connect(socket_path)
+        if stream:
+            logger.warning("Served assistants can't stream responses, ignoring it.")
+            stream = False
+    else:
+        # Haystack is imported here, and not at module level, so that other commands
+        # (and `--help`) don't pay for its slow import.
+        from haystack.nodes.prompt.invocation_layer import (
+            DefaultTokenStreamingHandler,
+        )
+
+        from ronin.assistants import ProactiveChatAssistant
+
+        assistant = build_assistant(
+            assistant_id, system_message=system_message, max_length=max_length
+        )
+        if assistant is None:
+            return
+
+        if stream:
+            chat_node_kwargs["stream_handler"] = DefaultTokenStreamingHandler()
+
+        if isinstance(assistant, ProactiveChatAssistant):
+            sys.stdout.write("Assistant:\n")
+            response = await assistant.aproactively_send_message(
+                chat_node_kwargs=chat_node_kwargs
+            )
+            _write_response(response, streamed=stream)
+
+    logger.info("Initializing chat:")
+    message = first_message
+    if not message:
+        message = click.prompt("User", type=str)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(f"User:\n{message}\n\n")
+
+    while message != "exit":
+        sys.stdout.write("Assistant:\n")
+        response = await assistant.achat(message, chat_node_kwargs=chat_node_kwargs)
+        _write_response(response, streamed=stream)
+
+        if interactive:
+            message = click.prompt("User", type=str)
+            sys.stdout.write("\n")
+        else:
+            break
+
+    if socket_path:
+        await assistant.close()
+
+    if output_path:
+        _dump_history(assistant.history, output_path)
+
+
+def build_assistant(
+    assistant_id: str, system_message: str = "", max_length: int = 100
+) -> "ChatAssistant | None":
+    """Build the assistant registered as `assistant_id`, backed by Azure OpenAI.
+
+    Returns `None` if the assistant requires arguments that can't be given through
+    the cli.
+    """
+    # Haystack is imported here, and not at module level, so that other commands
+    # (and `--help`) don't pay for its slow import.
+    from haystack.nodes import PromptModel, PromptNode
+
+    from ronin.assistants import AssistantRegister
+    from ronin.prompts.templates import SystemPromptTemplate
+
+    settings = get_settings()
+    deployment = settings.azure_openai_chatgpt_deployment
+
     logger.info("Connecting to OpenAI.")
     prompt_azure_openai = PromptModel(
-        model_name_or_path=settings.azure_openai_chatgpt_deployment,
+        model_name_or_path=deployment,
         api_key=settings.azure_openai_api_key,
         model_kwargs={
             "api_version": settings.azure_openai_api_version,
             "azure_base_url": settings.azure_openai_endpoint,
-            "azure_deployment_name": settings.azure_openai_chatgpt_deployment,
+            "azure_deployment_name": deployment,
         },
         max_length=max_length,
     )
@@ -71,45 +168,38 @@ async def chat(
     logger.debug(f"Loading {assistant_id}.")
     Assistant = AssistantRegister.get(assistant_id)
 
-    assistant_kwargs = {}
+    assistant_kwargs = {"chat_node": openai_node}
     if system_message:
         logger.debug("Building system message.")
         assistant_kwargs["chat_system_prompt"] = SystemPromptTemplate.from_str(
             system_message
         )
 
-    try:
-        logger.info(f"Starting {assistant_id} Assistant.")
-        assistant = Assistant(chat_node=openai_node, **assistant_kwargs)
-    except TypeError:
-        logger.exception(
+    missing_arguments = [
+        name
+        for name, parameter in inspect.signature(Assistant).parameters.items()
+        if parameter.default is parameter.empty and name not in assistant_kwargs
+    ]
+    if missing_arguments:
+        logger.error(
             f"Could not instantiate {assistant_id} Assistant. "
-            f"Make sure you have passed all required arguments."
+            f"Make sure you have passed all required arguments: {missing_arguments}."
         )
-        return
+        return None
 
-    if isinstance(assistant, ProactiveChatAssistant):
-        response = assistant.proactively_send_message()
-        print(f"Assistant:\n{response['content']}\n")
+    logger.info(f"Starting {assistant_id} Assistant.")
+    return Assistant(**assistant_kwargs)
 
-    logger.info("Initializing chat:")
-    message = first_message
-    if not message:
-        message = click.prompt("User", type=str)
-        print()
-    else:
-        print(f"User:\n{message}\n")
 
-    while message != "exit":
-        response = assistant.chat(message)
-        print(f"Assistant:\n{response['content']}\n")
+def _write_response(response: ChatMessage, streamed: bool):
+    """Write the assistant's response to stdout, flushing it once per response."""
+    # Streamed tokens were already written, without a trailing new line
+    sys.stdout.write("\n\n" if streamed else f"{response['content']}\n\n")
+    sys.stdout.flush()
 
-        if interactive:
-            message = click.prompt("User", type=str)
-            print()
-        else:
-            break
 
-    if output_path:
-        with open(output_path, "w") as f:
-            json.dump(assistant.history, f, indent=4)
+def _dump_history(history: Iterable[ChatMessage], output_path: str):
+    """Dump chat history into a .json file."""
+    # Serialized at once, as `json.dump` writes the file in many small chunks
+    with open(output_path, "w") as f:
+        f.write(json.dumps(list(history), indent=4))
@@ -1,10 +1,12 @@
 import click
 
 from ronin.cli.chat import chat
+from ronin.cli.serve import serve
 
 @click.group()
 def ronin():
     """Ronin cli."""
     pass
 
-ronin.add_command(chat)
\ No newline at end of file
+ronin.add_command(chat)
+ronin.add_command(serve)
\ No newline at end of file
@@ -0,0 +1,170 @@
+import asyncio
+import contextlib
+import json
+import os
+from typing import TYPE_CHECKING, AsyncIterator
+
+import attrs
+import click
+from loguru import logger
+
+from ronin.cli import coroutine
+from ronin.cli.chat import build_assistant
+from ronin.typing_mixin import ChatMessage
+
+if TYPE_CHECKING:
+    from ronin.assistants import ChatAssistant
+
+
+@click.command(name="serve", help="Serve a Ronin assistant over a UNIX socket.")
+@coroutine
+@click.option(
+    "--assistant",
+    "-a",
+    "assistant_id",
+    default="base-chat-assistant",
+    help="ID of the assistant you want to serve.",
+)
+@click.option(
+    "--system-message",
+    default="",
+    help="System message to use. This overrides the existing system message.",
+)
+@click.option(
+    "--max-length",
+    default=100,
+    help="Maximum length of the response.",
+)
+@click.option(
+    "--socket-path",
+    envvar="RONIN_SOCKET",
+    required=True,
+    help="Path of the UNIX socket to listen on. Defaults to $RONIN_SOCKET.",
+)
+async def serve(
+    assistant_id: str,
+    system_message: str,
+    max_length: int,
+    socket_path: str,
+):
+    assistant = build_assistant(
+        assistant_id, system_message=system_message, max_length=max_length
+    )
+    if assistant is None:
+        return
+
+    async with assistant_server(assistant, socket_path) as server:
+        logger.info(f"Serving {assistant_id} Assistant at {socket_path}.")
+        await server.serve_forever()
+
+
+@contextlib.asynccontextmanager
+async def assistant_server(
+    assistant: "ChatAssistant", socket_path: str
+) -> AsyncIterator[asyncio.Server]:
+    """Serve `assistant` at `socket_path`, until the context is exited.
+
+    Each line received is a JSON request, e.g. `{"message": "Hi!"}`, answered with
+    a JSON line: either the assistant's response, or `{"error": ...}` if the request
+    could not be answered. Errors don't close the connection. Once the server is
+    closed, the socket file is removed.
+    """
+    # All connections share the assistant's history, so requests are answered one
+    # at a time.
+    lock = asyncio.Lock()
+
+    async def answer(line: bytes) -> dict:
+        try:
+            message = json.loads(line)["message"]
+        except (ValueError, KeyError, TypeError) as error:
+            logger.error(f"Invalid request {line!r}: {error!r}")
+            return {"error": f"Invalid request: {error!r}"}
+
+        try:
+            async with lock:
+                return await assistant.achat(message)
+        except Exception as error:
+            logger.exception(f"Assistant failed to answer: {error!r}")
+            return {"error": f"Assistant failed to answer: {error!r}"}
+
+    async def handle_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        while line := await reader.readline():
+            response = await answer(line)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        # Not waiting for the connection to be closed, so that the handler is done
+        # by the time the client sees the connection closed
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+    try:
+        async with server:
+            yield server
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+
+
+@attrs.define
+class AssistantClient:
+    """Client of an assistant served by the `serve` command.
+
+    It mimics the part of the `ChatAssistant` interface used by the `chat` command.
+
+    Attributes
+    ----------
+    reader : asyncio.StreamReader
+        Stream to read the served assistant's responses from.
+    writer : asyncio.StreamWriter
+        Stream to write requests to the served assistant to.
+    history : list[ChatMessage]
+        The messages exchanged through this client.
+    """
+
+    reader: asyncio.StreamReader = attrs.field(repr=False)
+    writer: asyncio.StreamWriter = attrs.field(repr=False)
+    history: list[ChatMessage] = attrs.field(factory=list, repr=False, init=False)
+
+    @classmethod
+    async def connect(cls, socket_path: str) -> "AssistantClient":
+        """Connect to the assistant served at `socket_path`."""
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        return cls(reader=reader, writer=writer)
+
+    async def achat(self, message: str, **kwargs) -> ChatMessage:
+        """Chat with the served assistant.
+
+        Keyword arguments are ignored, they can't be sent to the served assistant.
+
+        Raises
+        ------
+        RuntimeError
+            If the served assistant could not answer the message.
+        """
+        self.writer.write(json.dumps({"message": message}).encode() + b"\n")
+        await self.writer.drain()
+
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Served assistant closed the connection.")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(f"Served assistant failed: {response['error']}")
+
+        self.history.extend([{"role": "user", "content": message}, response])
+        return response
+
+    async def close(self):
+        """Close the connection to the served assistant.
+
+        The served assistant is first told that no more requests are coming, and the
+        connection is closed once it has closed its side.
+        """
+        self.writer.write_eof()
+        await self.reader.read()
+        self.writer.close()
+        await self.writer.wait_closed()
@@ -1,5 +1,7 @@
 """Pydantic settings for Ronin."""
 
+import functools
+
 from dotenv import load_dotenv
 from pydantic import BaseSettings, root_validator
 
@@ -16,7 +18,7 @@ class Settings(BaseSettings):
     azure_openai_chatgpt_deployment: str
 
     # XXX: When updating pydantic to v2, check: https://stackoverflow.com/a/76301965/7454638
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def _set_azure_openai_endpoint(cls, values):
         values[
             "azure_openai_endpoint"
@@ -24,5 +26,8 @@ class Settings(BaseSettings):
         return values
 
 
-load_dotenv()
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load Ronin's settings on first use, reading the .env file if there is one."""
+    load_dotenv()
+    return Settings()
@@ -1,10 +1,38 @@
-from ronin.prompts.templates import UserMessageTemplate
+from functools import partial
+from typing import Any
+
+from ronin.prompts.templates import AssistantMessageTemplate, UserMessageTemplate
 
 # XXX: We should evaluate whether we want to keep a large file full of templates,
 # or if we want to manage defaults scattered across the codebase.
-DEFAULT_PROACTIVE_MESSAGE_TRIGGER = UserMessageTemplate.from_str(
-    prompt=(
-        "Generate 5 questions to the user that will help you get all the information "
-        "that is relevant for you to fulfill your task."
-    )
-)
+
+# Templates shared by every assistant that does not override them, thus they must
+# not be mutated. Building a template imports Haystack, so each one is only built on
+# first access, see `__getattr__`.
+_DEFAULT_TEMPLATES = {
+    "DEFAULT_USER_MESSAGE_TEMPLATE": UserMessageTemplate.with_dummy_template,
+    "DEFAULT_ASSISTANT_MESSAGE_TEMPLATE": AssistantMessageTemplate.with_dummy_template,
+    "DEFAULT_PROACTIVE_MESSAGE_TRIGGER": partial(
+        UserMessageTemplate.from_str,
+        prompt=(
+            "Generate 5 questions to the user that will help you get all the "
+            "information that is relevant for you to fulfill your task."
+        ),
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build default templates on first access (PEP 562)."""
+    if name not in _DEFAULT_TEMPLATES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = _DEFAULT_TEMPLATES[name]()
+    return globals()[name]
+
+
+__all__ = [
+    "DEFAULT_USER_MESSAGE_TEMPLATE",
+    "DEFAULT_ASSISTANT_MESSAGE_TEMPLATE",
+    "DEFAULT_PROACTIVE_MESSAGE_TRIGGER",
+]
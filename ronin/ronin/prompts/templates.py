@@ -1,20 +1,32 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import attrs
-from haystack.nodes import PromptTemplate
 
 from ronin.typing_mixin import ChatMessage
 
+# Haystack is only imported once a template is built, see `_prompt_template`
+if TYPE_CHECKING:
+    from haystack.nodes import PromptTemplate
+
+
+def _prompt_template(prompt: str) -> PromptTemplate:
+    from haystack.nodes import PromptTemplate
+
+    return PromptTemplate(prompt=prompt)
+
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class BaseChatPromptTemplate(ABC):
     prompt: PromptTemplate
     role_field_name: str = "role"
     message_field_name: str = "content"
 
     @classmethod
-    def from_str(cls, prompt: str, **kwargs) -> "BaseChatPromptTemplate":
-        return cls(prompt=PromptTemplate(prompt=prompt), **kwargs)
+    def from_str(cls, prompt: str, **kwargs) -> BaseChatPromptTemplate:
+        return cls(prompt=_prompt_template(prompt), **kwargs)
 
     @abstractmethod
     def fill(self, *args, **kwargs) -> ChatMessage:
@@ -23,36 +35,36 @@ class BaseChatPromptTemplate(ABC):
     def _fill(self, role: str, *args, **kwargs) -> ChatMessage:
         return {
             self.role_field_name: role,
-            self.message_field_name: list(self.prompt.fill(*args, **kwargs))[0],
+            self.message_field_name: next(iter(self.prompt.fill(*args, **kwargs))),
         }
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class BaseChatMessageTemplate(BaseChatPromptTemplate, ABC):
     message_prompt_parameter: str = "message"
 
     @classmethod
-    def with_dummy_template(cls, **kwargs) -> "BaseChatPromptTemplate":
+    def with_dummy_template(cls, **kwargs) -> BaseChatPromptTemplate:
         return cls(
-            prompt=PromptTemplate(prompt="{message}"),
+            prompt=_prompt_template("{message}"),
             message_prompt_parameter="message",
             **kwargs,
         )
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class SystemPromptTemplate(BaseChatPromptTemplate):
     def fill(self, *args, **kwargs):
         return self._fill(role="system", *args, **kwargs)
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class UserMessageTemplate(BaseChatMessageTemplate):
     def fill(self, *args, **kwargs):
         return self._fill(role="user", *args, **kwargs)
 
 
-@attrs.define
+@attrs.define(eq=False, weakref_slot=False)
 class AssistantMessageTemplate(BaseChatMessageTemplate):
     def fill(self, *args, **kwargs):
         return self._fill(role="assistant", *args, **kwargs)
@@ -1,5 +1,5 @@
 from typing import Literal
 
 
-ChatMessage = dict[Literal["role", "message"], str]
+ChatMessage = dict[Literal["role", "content"], str]
 """A chat message in a conversation with AI assistants."""
@@ -0,0 +1,44 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from ronin.cli.serve import AssistantClient, assistant_server
+
+
+class EchoAssistant:
+    """Assistant answering with the message, unless it's asked to fail."""
+
+    async def achat(self, message: str, **kwargs):
+        if message == "fail":
+            raise ValueError("Asked to fail.")
+        return {"role": "assistant", "content": message}
+
+
+def test_served_assistant_errors_keep_connection_open(tmp_path):
+    socket_path = str(tmp_path / "ronin.sock")
+
+    async def chat():
+        async with assistant_server(EchoAssistant(), socket_path):
+            client = await AssistantClient.connect(socket_path)
+
+            # Invalid requests are answered with an error
+            for request in [b"not json\n", b'{"text": "Hi!"}\n']:
+                client.writer.write(request)
+                await client.writer.drain()
+                assert "error" in json.loads(await client.reader.readline())
+
+            with pytest.raises(RuntimeError, match="Asked to fail"):
+                await client.achat("fail")
+
+            response = await client.achat("Hi!")
+            await client.close()
+
+        return client, response
+
+    client, response = asyncio.run(chat())
+
+    assert not os.path.exists(socket_path)
+    assert response == {"role": "assistant", "content": "Hi!"}
+    assert client.history == [{"role": "user", "content": "Hi!"}, response]
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from tidder.transforms import embedding  # noqa: E402
+
+
+class LengthModel:
+    """Model embedding sentences by their length, recording what it embeds."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, sentences, **kwargs):
+        self.encoded.append(sentences)
+        return np.array([[len(sentence)] for sentence in sentences], dtype=np.float32)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = LengthModel()
+    monkeypatch.setitem(embedding._SENTENCE_TRANSFORMERS, ("length", "fp32"), model)
+    return model
+
+
+def test_sentence_embedder_embeds_duplicates_once(model):
+    embedder = embedding.SentenceEmbedder("length")
+
+    embeddings = embedder.transform(["ab", "a", "ab", "abc"])
+
+    assert model.encoded == [["ab", "a", "abc"]]
+    np.testing.assert_array_equal(embeddings, [[2], [1], [2], [3]])
+
+
+@pytest.mark.parametrize("missing", [None, np.nan])
+def test_sentence_embedder_rejects_missing_sentences(model, missing):
+    embedder = embedding.SentenceEmbedder("length")
+
+    with pytest.raises(ValueError, match="missing"):
+        embedder.transform(["ab", missing, "ab", "abc"])
+
+    assert model.encoded == []
@@ -1,3 +1,7 @@
+import hashlib
+import os
+import tempfile
+
 import attrs
 import polars as pl
 
@@ -25,13 +29,44 @@ class Captions:
     end_column: str
     text_column: str
 
+    def __attrs_post_init__(self):
+        # Keep captions sorted by start time, so that reading their content doesn't
+        # sort them again on every call
+        if not self.df[self.start_column].is_sorted():
+            self.df = self.df.sort(by=self.start_column)
+
     @classmethod
     def from_file(
-        cls, captions_file: str, reader: CaptionsReader = CaptionsReader()
+        cls,
+        captions_file: str,
+        reader: CaptionsReader = CaptionsReader(),
+        cache_dir: str | None = None,
     ) -> "Captions":
-        """Creates a Captions object from captions files."""
-        captions_df = reader.read_captions(captions_file)
-        captions_df = reader.clean_captions(captions_df)
+        """Creates a Captions object from captions files.
+
+        Parameters
+        ----------
+        captions_file : str
+            The captions file to read.
+        reader : CaptionsReader, optional
+            The reader used to read and clean the captions.
+        cache_dir : str, optional, default None
+            Directory where cleaned captions are cached as parquet files. While a
+            captions file is left unchanged, its cached captions are read instead of
+            parsing it again. By default, nothing is cached.
+        """
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = cls._get_cache_file(captions_file, reader, cache_dir)
+
+        if cache_file is not None and os.path.exists(cache_file):
+            captions_df = pl.read_parquet(cache_file)
+        else:
+            captions_df = reader.read_captions(captions_file)
+            captions_df = reader.clean_captions(captions_df)
+
+            if cache_file is not None:
+                cls._write_cache_file(captions_df, cache_file)
 
         return cls(
             df=captions_df,
@@ -40,6 +75,34 @@ class Captions:
             text_column=reader.text_column,
         )
 
+    @staticmethod
+    def _get_cache_file(
+        captions_file: str, reader: CaptionsReader, cache_dir: str
+    ) -> str:
+        """Get the cache file of a captions file, keyed by its path and mtime."""
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # The reader is part of the key, as it defines the cached columns
+        key = f"{os.path.abspath(captions_file)}:{os.stat(captions_file).st_mtime_ns}"
+        key = hashlib.sha256(f"{key}:{reader!r}".encode()).hexdigest()
+        return os.path.join(cache_dir, f"{key}.parquet")
+
+    @staticmethod
+    def _write_cache_file(captions_df: pl.DataFrame, cache_file: str):
+        """Write captions into their cache file."""
+        # Written next to the cache file, then moved in place at once, so that an
+        # interrupted or concurrent write can't leave a truncated cache file behind
+        fd, temp_file = tempfile.mkstemp(
+            suffix=".parquet.tmp", dir=os.path.dirname(cache_file)
+        )
+        os.close(fd)
+        try:
+            captions_df.write_parquet(temp_file, compression="zstd")
+            os.replace(temp_file, cache_file)
+        except BaseException:
+            os.remove(temp_file)
+            raise
+
     def get_content(self, concat_symbol: str = " ") -> str:
         """Get captions content.
 
@@ -48,13 +111,11 @@ class Captions:
         concat_symbol : str, optional, default " "
             The symbol to be used to concatenate the captions.
         """
-        return concat_symbol.join(
-            self.df.sort(by=self.start_column)[self.text_column].to_list()
-        )
+        return self.df.select(pl.col(self.text_column).str.concat(concat_symbol)).item()
 
     def groupby(self, by: str) -> Generator[tuple[str, "Captions"], None, None]:
         """Groups captions by a column."""
-        for group_id, group_df in self.df.groupby(by, maintain_order=True):
+        for group_id, group_df in self.df.group_by(by, maintain_order=True):
             yield (
                 group_id,
                 Captions(
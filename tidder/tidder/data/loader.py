@@ -6,14 +6,6 @@ import polars as pl
 from tidder.dependencies import webvtt
 
 
-def to_seconds(time: str) -> float:
-    """Convert time string into seconds."""
-    seconds = 0.0
-    for part in time.split(":"):
-        seconds = seconds * 60 + float(part)
-    return seconds
-
-
 @attrs.define
 class CaptionsReader:
     """Process captions files.
@@ -33,15 +25,26 @@ class CaptionsReader:
         """Read captions from a .vtt file."""
         captions: webvtt.WebVTT = webvtt.read(captions_file)
 
+        # WebVTT already parses timestamps into seconds, use them as they are instead
+        # of parsing the formatted timestamps again, and build the DataFrame from
+        # columns rather than from a dictionary per caption.
+        starts, ends, texts = [], [], []
+        for caption in cast(webvtt.Caption, captions):
+            starts.append(caption.start_in_seconds)
+            ends.append(caption.end_in_seconds)
+            texts.append(caption.text.strip())
+
         return pl.DataFrame(
-            [
-                {
-                    self.start_column: to_seconds(caption.start),
-                    self.end_column: to_seconds(caption.end),
-                    self.text_column: caption.text.strip(),
-                }
-                for caption in cast(webvtt.Caption, captions)
-            ]
+            {
+                self.start_column: starts,
+                self.end_column: ends,
+                self.text_column: texts,
+            },
+            schema={
+                self.start_column: pl.Float64,
+                self.end_column: pl.Float64,
+                self.text_column: pl.Utf8,
+            },
         )
 
     def clean_captions(
@@ -73,9 +76,8 @@ class CaptionsReader:
             The cleaned captions DataFrame.
         """
         return (
-            captions_df.with_columns(
-                pl.col(self.text_column).str.split(caption_splitter)
-            )
+            captions_df.lazy()
+            .with_columns(pl.col(self.text_column).str.split(caption_splitter))
             .explode(self.text_column)
             # Add a temporary column where its value increments whenever the text changes.
             # https://github.com/pola-rs/polars/issues/9328#issue-1750954001
@@ -89,12 +91,13 @@ class CaptionsReader:
             .with_columns(
                 pl.col(self.text_column).rle_id().alias(temporary_group_column)
             )
-            .group_by(temporary_group_column)
+            # Groups are kept in order of appearance, which is the order of their ids
+            .group_by(temporary_group_column, maintain_order=True)
             .agg(
                 pl.col(self.start_column).min(),
                 pl.col(self.end_column).max(),
                 pl.col(self.text_column).first(),
             )
-            .sort(temporary_group_column)
             .drop(temporary_group_column)
+            .collect()
         )
@@ -4,6 +4,7 @@ import attrs
 import polars as pl
 
 from tidder.data.captions import Captions
+from tidder.dependencies import _ORJSON_AVAILABLE, orjson
 from tidder.typing_mixin import TimeBasedInfo
 
 
@@ -65,8 +66,7 @@ class Video:
         if captions_kwargs is None:
             captions_kwargs = {}
 
-        with open(video_info_file) as f:
-            video_info = json.load(f)
+        video_info = cls._load_video_info(video_info_file)
 
         captions = Captions.from_file(captions_file, **captions_kwargs)
         cls.augment_captions(
@@ -89,6 +89,16 @@ class Video:
             captions=captions,
         )
 
+    @staticmethod
+    def _load_video_info(video_info_file: str) -> dict:
+        """Load video info file, with `orjson` if it is installed."""
+        if _ORJSON_AVAILABLE:
+            with open(video_info_file, "rb") as f:
+                return orjson.loads(f.read())
+
+        with open(video_info_file) as f:
+            return json.load(f)
+
     @staticmethod
     def augment_captions(
         captions: Captions,
@@ -110,7 +120,7 @@ class Video:
             default_value=0,
         )
 
-    def get_chapters_content(self, concat_symbol: str = " ") -> str:
+    def get_chapters_content(self, concat_symbol: str = " ") -> dict[str, str]:
         """Get chapters content.
 
         Parameters
@@ -118,7 +128,9 @@ class Video:
         concat_symbol : str, optional, default " "
             The symbol to be used to concatenate the chapters.
         """
-        return {
-            chapter_name: captions.get_content(concat_symbol=concat_symbol)
-            for chapter_name, captions in self.captions.groupby(by="chapters")
-        }
+        # Aggregate all chapters at once, captions are already sorted by start time
+        chapters_content = self.captions.df.group_by(
+            "chapters", maintain_order=True
+        ).agg(pl.col(self.captions.text_column).str.concat(concat_symbol))
+
+        return dict(chapters_content.iter_rows())
@@ -9,27 +9,54 @@ confusion in the global environment. This way we have a valid proxy
 module for our own use, but it lives *exclusively* within ~polars~ tidder.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from polars.dependencies import _lazy_import
 
-_WEBVTT_AVAILABLE = True
-_PYPLOT_AVAILABLE = True
-
 # Handle static type checking
 # https://docs.python.org/3/library/typing.html#typing.TYPE_CHECKING
 if TYPE_CHECKING:
+    import orjson
     import webvtt
     from matplotlib import pyplot
-else:
-    webvtt, _WEBVTT_AVAILABLE = _lazy_import("webvtt")
-    pyplot, _PYPLOT_AVAILABLE = _lazy_import("matplotlib.pyplot")
+
+    _WEBVTT_AVAILABLE: bool
+    _PYPLOT_AVAILABLE: bool
+    _ORJSON_AVAILABLE: bool
+
+# Lazy-loaded modules, mapped to the name of their availability flag
+_LAZY_MODULES = {
+    "webvtt": ("webvtt", "_WEBVTT_AVAILABLE"),
+    "pyplot": ("matplotlib.pyplot", "_PYPLOT_AVAILABLE"),
+    "orjson": ("orjson", "_ORJSON_AVAILABLE"),
+}
+_FLAGS = {flag: name for name, (_, flag) in _LAZY_MODULES.items()}
+
+
+def __getattr__(name: str) -> Any:
+    """Build lazy-loaded modules, and their flags, on first access (PEP 562).
+
+    Looking up a module's availability is not free, e.g. finding the spec of
+    `matplotlib.pyplot` imports `matplotlib` itself, so it is only done for modules
+    that are actually used.
+    """
+    module_name = _FLAGS.get(name, name)
+    if module_name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import_name, flag = _LAZY_MODULES[module_name]
+    module, available = _lazy_import(import_name)
+    globals().update({module_name: module, flag: available})
+    return globals()[name]
+
 
 __all__ = [
     # Lazy-loaded modules
     "webvtt",
     "pyplot",
+    "orjson",
     # Flags
     "_WEBVTT_AVAILABLE",
     "_PYPLOT_AVAILABLE",
+    "_ORJSON_AVAILABLE",
 ]
@@ -1,8 +1,11 @@
 """Builder and director pattern for BERTopic model."""
 
+import hashlib
+import os
 from enum import Enum
 
 import attrs
+import numpy as np
 import pandas as pd
 from bertopic import BERTopic
 from bertopic.representation import (
@@ -11,8 +14,9 @@ from bertopic.representation import (
     MaximalMarginalRelevance,
     TextGeneration,
 )
-from typing import Self
+from typing import Literal, Self
 from bertopic.vectorizers import ClassTfidfTransformer
+from numpy.typing import ArrayLike, DTypeLike
 from sklearn.feature_extraction.text import (
     CountVectorizer,
     HashingVectorizer,
@@ -22,6 +26,7 @@ from sklearn.feature_extraction.text import (
 from transformers import pipeline
 
 from tidder.models.clustering import ClusteringBuilder
+from tidder.transforms.embedding import load_sentence_transformer
 
 
 # enum for topic representation aspects
@@ -34,6 +39,69 @@ class TopicRepresentationAspect(str, Enum):
 class BERTopicDirector:
     """Define blueprints for building BERTopic models."""
 
+    @staticmethod
+    def embed_documents(
+        model_name: str,
+        documents: ArrayLike,
+        precision: Literal["fp32", "fp16"] = "fp32",
+        cache_dir: str | None = None,
+        dtype: DTypeLike = np.float32,
+        batch_size: int = 32,
+    ) -> np.ndarray:
+        """Embed documents, the most expensive step of building a BERTopic model.
+
+        Parameters
+        ----------
+        model_name : str
+            Name or path of the SentenceTransformer model used to embed the
+            documents, see `load_sentence_transformer`.
+        documents : array-like of str
+            Documents to embed.
+        precision : {"fp32", "fp16"}, optional, default "fp32"
+            Precision of the model's weights.
+        cache_dir : str, optional, default None
+            Directory where embeddings are saved as .npy files, keyed by the hash of
+            the model's name and precision and of the documents, and by their data
+            type. Embeddings of documents seen before are memory-mapped from it
+            instead of computed.
+        dtype : data-type, optional, default np.float32
+            Data type of the embeddings. `np.float16` halves their memory and cache
+            size, but keep in mind that some models (e.g. sklearn's KMeans) convert
+            half precision inputs to `np.float64`.
+        batch_size : int, optional, default 32
+            Number of documents embedded at once. Larger batches make better use of
+            GPUs, as long as they fit in their memory.
+        """
+        cache_file = None
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+            documents_hash = hashlib.blake2b(digest_size=16)
+            documents_hash.update(f"{model_name}\0{precision}\0".encode())
+            for document in documents:
+                documents_hash.update(document.encode())
+                documents_hash.update(b"\0")
+
+            cache_file = os.path.join(
+                cache_dir, f"{documents_hash.hexdigest()}-{np.dtype(dtype).name}.npy"
+            )
+
+        if cache_file is not None and os.path.exists(cache_file):
+            return np.load(cache_file, mmap_mode="r")
+
+        embedding_model = load_sentence_transformer(model_name, precision)
+        embeddings = embedding_model.encode(
+            documents,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype(dtype, copy=False)
+
+        if cache_file is not None:
+            np.save(cache_file, embeddings)
+
+        return embeddings
+
     @classmethod
     def build_bertopic(
         cls,
@@ -42,20 +110,42 @@ class BERTopicDirector:
         random_state: int,
         fit: bool = True,
         plot: bool = False,
+        embeddings: np.ndarray | None = None,
+        embeddings_cache_dir: str | None = None,
+        n_clusters: int | None = None,
     ) -> BERTopic:
-        """Build BERTopic model."""
+        """Build BERTopic model.
+
+        Documents are embedded with `embed_documents`, caching their embeddings in
+        `embeddings_cache_dir` if given, unless their `embeddings` are given. Both let
+        models be rebuilt without embedding the same documents again.
+
+        By default, the number of topics is searched for with KMeans, which fits one
+        model per candidate. If `n_clusters` is given, the search is skipped and
+        documents are clustered with MiniBatchKMeans on 5 PCA components instead,
+        which is meant for quick previews.
+        """
         builder = BERTopicBuilder(random_state=random_state)
         builder.produce_sentence_transformer("all-MiniLM-L6-v2")
 
-        embedded_data = builder.embedding_model.encode(
-            data[target_column].values,
-            convert_to_tensor=True,
-            normalize_embeddings=True,
-        )
+        if embeddings is None:
+            embeddings = cls.embed_documents(
+                builder.embedding_model_name,
+                data[target_column].values,
+                precision=builder.embedding_precision,
+                cache_dir=embeddings_cache_dir,
+            )
 
-        builder.produce_identity_dimensionality_reduction().produce_kmeans(
-            k_range=range(2, 20), plot=plot
-        ).produce_count_vectorizer(
+        if n_clusters is None:
+            builder.produce_identity_dimensionality_reduction().produce_kmeans(
+                k_range=range(2, 20), plot=plot
+            )
+        else:
+            builder.produce_incremental_pca(n_components=5).produce_minibatch_kmeans(
+                n_clusters=n_clusters
+            )
+
+        builder.produce_count_vectorizer(
             stop_words="english", ngram_range=(1, 3)
         ).produce_class_tfidf(
             reduce_frequent_words=True
@@ -80,7 +170,7 @@ class BERTopicDirector:
         ).build()
 
         if fit:
-            builder.bertopic.fit(data[target_column].values, embedded_data.numpy())
+            builder.bertopic.fit(data[target_column].values, embeddings)
 
         return builder.bertopic
 
@@ -91,21 +181,28 @@ class BERTopicDirector:
         target_column: str,
         random_state: int,
         fit: bool = True,
+        embeddings: np.ndarray | None = None,
+        embeddings_cache_dir: str | None = None,
     ) -> BERTopic:
         """Build BERTopic model with soft clustering.
 
         Soft clustering allows a document to be part of multiple documents.
         It takes out the "decision" aspect in hard clustering and returns the probability of a
         document belonging to a topic.
+
+        Refer to `build_bertopic` for the `embeddings` and `embeddings_cache_dir`
+        description.
         """
         builder = BERTopicBuilder(random_state=random_state)
         builder.produce_sentence_transformer("all-MiniLM-L6-v2")
 
-        embedded_data = builder.embedding_model.encode(
-            data[target_column].values,
-            convert_to_tensor=True,
-            normalize_embeddings=True,
-        )
+        if embeddings is None:
+            embeddings = cls.embed_documents(
+                builder.embedding_model_name,
+                data[target_column].values,
+                precision=builder.embedding_precision,
+                cache_dir=embeddings_cache_dir,
+            )
 
         builder.produce_umap_dimensionality_reduction(
             n_components=50
@@ -133,7 +230,7 @@ class BERTopicDirector:
         ).build()
 
         if fit:
-            builder.bertopic.fit(data[target_column].values, embedded_data.numpy())
+            builder.bertopic.fit(data[target_column].values, embeddings)
 
         return builder.bertopic
 
@@ -289,16 +386,15 @@ class BERTopicBuilder(ClusteringBuilder):
         if self.representation_model is None:
             self.representation_model = {}
 
-        if representation_id not in self.representation_model:
-            self.representation_model[representation_id] = []
-
         if append:
-            if not isinstance(self.representation_model[representation_id], list):
-                self.representation_model[representation_id] = [
-                    self.representation_model[representation_id]
-                ]
+            representations = self.representation_model.setdefault(
+                representation_id, []
+            )
+            if not isinstance(representations, list):
+                representations = [representations]
+                self.representation_model[representation_id] = representations
 
-            self.representation_model[representation_id].append(representation)
+            representations.append(representation)
         else:
             self.representation_model[representation_id] = representation
 
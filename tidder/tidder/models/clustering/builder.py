@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Self
+from typing import Any, Literal, Self
 
 import attrs
 from sentence_transformers import SentenceTransformer
 from sklearn.base import ClusterMixin
-from sklearn.cluster import DBSCAN
-from sklearn.decomposition import PCA
+from sklearn.cluster import DBSCAN, MiniBatchKMeans
+from sklearn.decomposition import PCA, IncrementalPCA
 from umap import UMAP
 
 from tidder.transforms.dimensionality_reduction import DummyDimensionalityReduction
+from tidder.transforms.embedding import load_sentence_transformer
 
 from .gaussian_mixture import AutoGaussianMixture
 from .kmeans import AutoKMeans
@@ -30,6 +31,10 @@ class ClusteringBuilder(ABC):
         Random state to be used in experiments.
     embedding_model : `SentenceTransformer` or None
         Embedding model to be used in experiments.
+    embedding_model_name : str or None
+        Name or path of the embedding model.
+    embedding_precision : {"fp32", "fp16"}
+        Precision of the embedding model's weights.
     clustering_model : `ClusterMixin` or None
         Clustering model to be used in experiments.
     dimensionality_reduction_model : `TransformerMixin` or None
@@ -39,6 +44,10 @@ class ClusteringBuilder(ABC):
     random_state: int = attrs.field(default=42, kw_only=True)
 
     embedding_model: SentenceTransformer | None = attrs.field(default=None, init=False)
+    embedding_model_name: str | None = attrs.field(default=None, init=False)
+    embedding_precision: Literal["fp32", "fp16"] = attrs.field(
+        default="fp32", init=False
+    )
     clustering_model: ClusterMixin | None = attrs.field(default=None, init=False)
     dimensionality_reduction_model: ClusterMixin | None = attrs.field(
         default=None, init=False
@@ -49,9 +58,30 @@ class ClusteringBuilder(ABC):
         """Build experiment pipeline."""
         raise NotImplementedError
 
-    def produce_sentence_transformer(self, model_name: str) -> Self:
-        """Use SentenceTransformer for embedding."""
-        self.embedding_model = SentenceTransformer(model_name)
+    def produce_sentence_transformer(
+        self, model_name: str, precision: Literal["fp32", "fp16"] = "fp32", **kwargs
+    ) -> Self:
+        """Use SentenceTransformer for embedding.
+
+        Models are loaded once per name and precision, see
+        `load_sentence_transformer`.
+
+        Keyword arguments, e.g. the `device`, are passed to `SentenceTransformer`. By
+        default, it runs on GPU whenever one is available, be it CUDA or Apple's MPS.
+
+        Parameters
+        ----------
+        model_name: str
+            Name or path of the SentenceTransformer model.
+        precision: {"fp32", "fp16"}, default "fp32"
+            Precision of the model's weights. Half precision is only used on GPU,
+            where it roughly doubles the embedding throughput.
+        """
+        self.embedding_model = load_sentence_transformer(
+            model_name, precision, **kwargs
+        )
+        self.embedding_model_name = model_name
+        self.embedding_precision = precision
         return self
 
     def produce_pca(self, n_components: int) -> Self:
@@ -65,6 +95,19 @@ class ClusteringBuilder(ABC):
         self.dimensionality_reduction_model = PCA(n_components=n_components)
         return self
 
+    def produce_incremental_pca(self, n_components: int, **kwargs) -> Self:
+        """Use IncrementalPCA for dimensionality reduction.
+
+        Parameters
+        ----------
+        n_components: int
+            Number of desired components (n_features)
+        """
+        self.dimensionality_reduction_model = IncrementalPCA(
+            n_components=n_components, **kwargs
+        )
+        return self
+
     def produce_umap_dimensionality_reduction(self, **kwargs) -> Self:
         """Use UMAP for dimensionality reduction."""
         kwargs["random_state"] = self.random_state
@@ -90,6 +133,14 @@ class ClusteringBuilder(ABC):
         self.clustering_model = AutoKMeans(**kwargs)
         return self
 
+    def produce_minibatch_kmeans(self, n_clusters: int, **kwargs) -> Self:
+        """Use MiniBatchKMeans, with a fixed number of clusters, for clustering."""
+        kwargs["random_state"] = self.random_state
+        self.clustering_model = MiniBatchKMeans(
+            n_clusters=n_clusters, n_init="auto", **kwargs
+        )
+        return self
+
     def produce_spectral_clustering(self, **kwargs) -> Self:
         """Use SpectralClustering for clustering."""
         kwargs["random_state"] = self.random_state
@@ -97,7 +148,12 @@ class ClusteringBuilder(ABC):
         self.clustering_model = AutoSpectralClustering(**kwargs)
         return self
 
-    def produce_dbscan(self) -> Self:
-        """Use DBSCAN for clustering."""
-        self.clustering_model = DBSCAN()
+    def produce_dbscan(self, eps: float = 0.5, min_samples: int = 5, **kwargs) -> Self:
+        """Use DBSCAN for clustering.
+
+        Neighborhoods are queried over all processors, unless other `n_jobs` are
+        given. Keyword arguments are passed to `DBSCAN`.
+        """
+        kwargs.setdefault("n_jobs", -1)
+        self.clustering_model = DBSCAN(eps=eps, min_samples=min_samples, **kwargs)
         return self
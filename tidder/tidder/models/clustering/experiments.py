@@ -3,15 +3,23 @@ from typing import Self
 
 import attrs
 import numpy as np
+from joblib import Memory
 from sklearn.decomposition import PCA
 from sklearn.pipeline import Pipeline
 
 from tidder.dependencies import pyplot as plt
+from tidder.transforms.embedding import SentenceEmbedder
 from tidder.transforms.tracker import Tracker
 
 from .builder import ClusteringBuilder
 
 
+def _identity(x):
+    # Defined at module level, unlike a lambda, so that the pipeline's cache can
+    # pickle it
+    return x
+
+
 @attrs.define(kw_only=True)
 class ClusteringExperimenter(ClusteringBuilder):
     r"""Builder runner of clustering experiments.
@@ -20,6 +28,10 @@ class ClusteringExperimenter(ClusteringBuilder):
     ----------
     plot : bool, default to True
         Whether to plot the clustering results.
+    cache_dir : str or None
+        Directory where to cache the fitted embedding and dimensionality reduction
+        steps, so that experiments sharing them with a previous one skip them.
+        By default, nothing is cached.
     experiment_pipeline : `Pipeline` or None
         Experiment pipeline.
 
@@ -29,6 +41,10 @@ class ClusteringExperimenter(ClusteringBuilder):
         Random state to be used in experiments.
     embedding_model : `SentenceTransformer` or None
         Embedding model to be used in experiments.
+    embedding_model_name : str or None
+        Name or path of the embedding model.
+    embedding_precision : {"fp32", "fp16"}
+        Precision of the embedding model's weights.
     clustering_model : `ClusterMixin` or None
         Clustering model to be used in experiments.
     dimensionality_reduction_model : `TransformerMixin` or None
@@ -36,13 +52,14 @@ class ClusteringExperimenter(ClusteringBuilder):
     """
 
     plot: int = attrs.field(default=True, kw_only=True)
+    cache_dir: str | None = attrs.field(default=None, kw_only=True)
     experiment_pipeline: Pipeline = attrs.field(default=None, init=False)
 
     _embeddings_tracker_step_name: str = attrs.field(
         default="_embeddings_tracker", init=False, repr=False
     )
     _embeddings_tracker: Tracker = attrs.field(
-        factory=partial(Tracker, info_extractor=lambda x: x), init=False, repr=False
+        factory=partial(Tracker, info_extractor=_identity), init=False, repr=False
     )
 
     def build(self, return_self: bool = True) -> Self | Pipeline:
@@ -53,15 +70,21 @@ class ClusteringExperimenter(ClusteringBuilder):
             raise ValueError("Clustering model must be provided.")
 
         steps = []
-        steps.append(("embedding", self.embedding_model))
+        embedder = SentenceEmbedder(self.embedding_model_name, self.embedding_precision)
+        steps.append(("embedding", embedder))
         if self.dimensionality_reduction_model is not None:
             steps.append(
                 ("dimensionality_reduction", self.dimensionality_reduction_model)
             )
-        steps.append((self._embeddings_tracker_step_name, self._embeddings_tracker))
+        # The tracked embeddings are only needed for plotting
+        if self.plot:
+            steps.append(
+                (self._embeddings_tracker_step_name, self._embeddings_tracker)
+            )
         steps.append(("clustering", self.clustering_model))
 
-        self.experiment_pipeline = Pipeline(steps)
+        memory = Memory(self.cache_dir, verbose=0) if self.cache_dir else None
+        self.experiment_pipeline = Pipeline(steps, memory=memory)
 
         if return_self:
             return self
@@ -92,7 +115,11 @@ class ClusteringExperimenter(ClusteringBuilder):
         # Project embeddings
         plottable_embedded_data = embedded_data
         if embedded_data.shape[1] > 2:
-            pca = PCA(n_components=2)
+            # Only 2 components are needed, which the randomized solver finds
+            # without a full SVD of the embeddings
+            pca = PCA(
+                n_components=2, svd_solver="randomized", random_state=self.random_state
+            )
             plottable_embedded_data = pca.fit_transform(embedded_data)
 
         # Getting unique labels
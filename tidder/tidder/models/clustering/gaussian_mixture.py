@@ -3,12 +3,35 @@ from typing import Iterable
 
 import attrs
 import numpy as np
+from joblib import Parallel, delayed
 from loguru import logger
 from sklearn.mixture import GaussianMixture
 
 from tidder.dependencies import pyplot as plt
 
 
+def _fit_gaussian_mixture(
+    k: int, X, random_state: int
+) -> tuple[int, float, float] | None:
+    """Fit a GaussianMixture with `k` components, returning `None` if it fails."""
+    try:
+        gmm = GaussianMixture(n_components=k, random_state=random_state)
+        start_time = time.time()
+        gmm.fit(X)
+        fit_time = time.time() - start_time
+        # AIC vs BIC: https://stats.stackexchange.com/a/767/207255
+        # > "AIC tries to select the model that most adequately describes an
+        #   unknown, high dimensional reality. [...] BIC tries to find the
+        #   TRUE model among the set of candidates."
+        aic = gmm.aic(X)
+    except Exception as e:
+        logger.error(f"Could not fit GaussianMixture with k={k}: {e}")
+        return None
+
+    # Only the score is sent back from the worker, the fitted model isn't needed
+    return k, aic, fit_time
+
+
 @attrs.define
 class AutoGaussianMixture(GaussianMixture):
     r"""Auto GaussianMixture for processing text inputs.
@@ -17,6 +40,9 @@ class AutoGaussianMixture(GaussianMixture):
     ----------
     k_range : iterable of int
         Options for the number of clusters.
+    n_jobs : int, default -1
+        Number of jobs used to fit the models of each option in `k_range`. -1 means
+        using all processors.
 
     Parameters
     ----------
@@ -29,6 +55,7 @@ class AutoGaussianMixture(GaussianMixture):
     k_range: Iterable[int] = attrs.field(default=range(2, 15), repr=False, kw_only=True)
     random_state: int = attrs.field(default=42, kw_only=True)
     plot: bool = attrs.field(default=False, kw_only=True)
+    n_jobs: int = attrs.field(default=-1, kw_only=True)
 
     labels_: np.ndarray = attrs.field(repr=False, init=False)
     fitted_: bool = attrs.field(repr=False, init=False)
@@ -57,61 +84,61 @@ class AutoGaussianMixture(GaussianMixture):
         self.fitted_ = True
         return self.labels_
 
-    def predict(self, X):
-        r"""Override predict function to skip `check_is_fitted`"""
+    def predict(self, X, chunk_size: int = 65536):
+        r"""Override predict function to skip `check_is_fitted`
+
+        Samples are predicted in chunks of `chunk_size`, so that the log
+        probabilities of all samples for all components are never held at once.
+        """
         X = self._validate_data(X, reset=False)
-        return self._estimate_weighted_log_prob(X).argmax(axis=1)
+        labels = np.empty(X.shape[0], dtype=np.intp)
+        for start in range(0, X.shape[0], chunk_size):
+            chunk = X[start : start + chunk_size]
+            labels[start : start + chunk_size] = self._estimate_weighted_log_prob(
+                chunk
+            ).argmax(axis=1)
+        return labels
 
     def _select_k(self, embedded_data):
-        all_gmm = {}
-        for k in self.k_range:
-            try:
-                gmm = GaussianMixture(n_components=k, random_state=self.random_state)
-                start_time = time.time()
-                gmm.fit(embedded_data)
-                fit_time = time.time() - start_time
-
-                all_gmm[k] = {
-                    "model": gmm,
-                    # AIC vs BIC: https://stats.stackexchange.com/a/767/207255
-                    # > "AIC tries to select the model that most adequately describes an
-                    #   unknown, high dimensional reality. [...] BIC tries to find the
-                    #   TRUE model among the set of candidates."
-                    "aic": gmm.aic(embedded_data),
-                    "fit_time": fit_time,
-                }
-            except Exception as e:
-                logger.error(f"Could not fit GaussianMixture with k={k}: {e}")
-
-        aic_points = np.array([(k, info["aic"]) for k, info in all_gmm.items()])
-        logger.trace(f"{aic_points.tolist()=}")
-        start = aic_points[0]
-        end = aic_points[-1]
+        # Each fit is independent, so they are spread over processes
+        results = Parallel(n_jobs=self.n_jobs, prefer="processes")(
+            delayed(_fit_gaussian_mixture)(k, embedded_data, self.random_state)
+            for k in self.k_range
+        )
+        results = [result for result in results if result is not None]
+        if not results:
+            raise ValueError(
+                f"Could not fit GaussianMixture with any k in {self.k_range}."
+            )
+
+        ks, aics, fit_times = zip(*results)
+        ks, aics, fit_times = np.array(ks), np.array(aics), np.array(fit_times)
+
+        logger.trace(f"{ks.tolist()=}, {aics.tolist()=}")
 
         # https://www.youtube.com/watch?v=tYUtWYGUqgw
-        all_gmm_score = np.cross(end - start, aic_points - start) / np.linalg.norm(
-            end - start
-        )
+        # 2D cross product of the chord from the first to the last point with each
+        # point. Dividing it by the chord's length doesn't change its argmin.
+        dk, dscore = ks[-1] - ks[0], aics[-1] - aics[0]
+        all_gmm_score = dk * (aics - aics[0]) - dscore * (ks - ks[0])
         best_gmm_index = np.argmin(all_gmm_score)
-        best_k = self.k_range[best_gmm_index]
+        best_k = int(ks[best_gmm_index])
 
         logger.trace(f"{all_gmm_score=}")
 
         if self.plot:
-            self._plot_elbow_analysis(all_gmm, best_k)
+            self._plot_elbow_analysis(ks, aics, fit_times, best_gmm_index)
 
         return best_k
 
-    def _plot_elbow_analysis(self, gmm_info, best_k):
-        k_range, aics, fit_times = zip(
-            *[(k, info["aic"], info["fit_time"]) for k, info in gmm_info.items()]
-        )
+    def _plot_elbow_analysis(self, ks, aics, fit_times, best_index):
+        best_k = ks[best_index]
 
         fig, aic_ax = plt.subplots()
         fit_time_ax = aic_ax.twinx()
 
-        fit_time_ax.plot(k_range, fit_times, "o--", c="#88b984")
-        aic_ax.plot(k_range, aics, "o-", c="C0")
+        fit_time_ax.plot(ks, fit_times, "o--", c="#88b984")
+        aic_ax.plot(ks, aics, "o-", c="C0")
 
         fit_time_ax.set_ylabel("fit time (seconds)", color="#88b984")
         fit_time_ax.tick_params(axis="y", colors="#88b984")
@@ -127,7 +154,7 @@ class AutoGaussianMixture(GaussianMixture):
             x=best_k,
             c="black",
             linestyle="dashed",
-            label=f"elbow at k = {best_k}, score = {round(gmm_info[best_k]['aic'], 3)}",
+            label=f"elbow at k = {best_k}, score = {round(aics[best_index], 3)}",
         )
         plt.legend(loc="upper right", frameon=True, framealpha=1)
         plt.show()
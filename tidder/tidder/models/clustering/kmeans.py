@@ -3,13 +3,42 @@ from typing import Iterable
 
 import attrs
 import numpy as np
+import torch
+from joblib import Parallel, delayed
 from loguru import logger
 from sentence_transformers import SentenceTransformer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.utils import check_array
 
 from tidder.dependencies import pyplot as plt
 
 
+def _fit_kmeans(
+    k: int, X, random_state: int
+) -> tuple[int, float, float] | None:
+    """Fit a KMeans model with `k` clusters, returning `None` if it fails.
+
+    The inertia is only used to select the number of clusters, so the cheaper
+    MiniBatchKMeans approximation is enough.
+    """
+    try:
+        kmeans = MiniBatchKMeans(
+            n_clusters=k,
+            random_state=random_state,
+            batch_size=min(1024, len(X)),
+            n_init=3,
+        )
+        start_time = time.time()
+        kmeans.fit(X)
+        fit_time = time.time() - start_time
+    except Exception as e:
+        logger.error(f"Could not fit KMeans with k={k}: {e}")
+        return None
+
+    # Only the score is sent back from the worker, the fitted model isn't needed
+    return k, kmeans.inertia_, fit_time
+
+
 @attrs.define
 class AutoKMeans(KMeans):
     r"""Auto KMeans for processing text inputs.
@@ -18,6 +47,9 @@ class AutoKMeans(KMeans):
     ----------
     k_range : iterable of int
         Options for the number of clusters.
+    n_jobs : int, default -1
+        Number of jobs used to fit the models of each option in `k_range`. -1 means
+        using all processors.
 
     Parameters
     ----------
@@ -30,6 +62,7 @@ class AutoKMeans(KMeans):
     k_range: Iterable[int] = attrs.field(default=range(2, 15), repr=False, kw_only=True)
     random_state: int = attrs.field(default=42, kw_only=True)
     plot: bool = attrs.field(default=False, kw_only=True)
+    n_jobs: int = attrs.field(default=-1, kw_only=True)
 
     def __attrs_post_init__(self):
         # Placeholder value for n_clusters, will be set in `fit`
@@ -53,60 +86,51 @@ class AutoKMeans(KMeans):
             are assigned equal weight. `sample_weight` is not used during
             initialization if `init` is a callable or a user provided array.
         """
+        # KMeans runs natively in float32, which halves the memory traffic of its
+        # distance computations compared to float64
+        X = check_array(X, accept_sparse="csr", dtype=np.float32, order="C")
         k = self._select_k(X)
         self.n_clusters = k
         return super().fit(X, None, sample_weight)
 
     def _select_k(self, embedded_data):
-        all_kmeans = {}
-        for k in self.k_range:
-            try:
-                kmeans = KMeans(
-                    n_clusters=k, random_state=self.random_state, n_init="auto"
-                )
-                start_time = time.time()
-                kmeans.fit(embedded_data)
-                fit_time = time.time() - start_time
-
-                all_kmeans[k] = {
-                    "model": kmeans,
-                    "inertia": kmeans.inertia_,
-                    "fit_time": fit_time,
-                }
-            except Exception as e:
-                logger.error(f"Could not fit KMeans with k={k}: {e}")
-
-        inertia_points = np.array(
-            [(k, info["inertia"]) for k, info in all_kmeans.items()]
+        # Each fit is independent, so they are spread over processes
+        results = Parallel(n_jobs=self.n_jobs, prefer="processes")(
+            delayed(_fit_kmeans)(k, embedded_data, self.random_state)
+            for k in self.k_range
         )
-        logger.trace(f"{inertia_points.tolist()=}")
-        start = inertia_points[0]
-        end = inertia_points[-1]
+        results = [result for result in results if result is not None]
+        if not results:
+            raise ValueError(f"Could not fit KMeans with any k in {self.k_range}.")
+
+        ks, inertias, fit_times = zip(*results)
+        ks, inertias, fit_times = np.array(ks), np.array(inertias), np.array(fit_times)
+
+        logger.trace(f"{ks.tolist()=}, {inertias.tolist()=}")
 
         # https://www.youtube.com/watch?v=tYUtWYGUqgw
-        all_kmeans_score = np.cross(
-            end - start, inertia_points - start
-        ) / np.linalg.norm(end - start)
+        # 2D cross product of the chord from the first to the last point with each
+        # point. Dividing it by the chord's length doesn't change its argmin.
+        dk, dscore = ks[-1] - ks[0], inertias[-1] - inertias[0]
+        all_kmeans_score = dk * (inertias - inertias[0]) - dscore * (ks - ks[0])
         best_kmeans_index = np.argmin(all_kmeans_score)
-        best_k = self.k_range[best_kmeans_index]
+        best_k = int(ks[best_kmeans_index])
 
         logger.trace(f"{all_kmeans_score=}")
 
         if self.plot:
-            self._plot_elbow_analysis(all_kmeans, best_k)
+            self._plot_elbow_analysis(ks, inertias, fit_times, best_kmeans_index)
 
         return best_k
 
-    def _plot_elbow_analysis(self, kmeans_info, best_k):
-        k_range, inertias, fit_times = zip(
-            *[(k, info["inertia"], info["fit_time"]) for k, info in kmeans_info.items()]
-        )
+    def _plot_elbow_analysis(self, ks, inertias, fit_times, best_index):
+        best_k = ks[best_index]
 
         fig, inertia_ax = plt.subplots()
         fit_time_ax = inertia_ax.twinx()
 
-        fit_time_ax.plot(k_range, fit_times, "o--", c="#88b984")
-        inertia_ax.plot(k_range, inertias, "o-", c="C0")
+        fit_time_ax.plot(ks, fit_times, "o--", c="#88b984")
+        inertia_ax.plot(ks, inertias, "o-", c="C0")
 
         fit_time_ax.set_ylabel("fit time (seconds)", color="#88b984")
         fit_time_ax.tick_params(axis="y", colors="#88b984")
@@ -122,7 +146,7 @@ class AutoKMeans(KMeans):
             x=best_k,
             c="black",
             linestyle="dashed",
-            label=f"elbow at k = {best_k}, score = {round(kmeans_info[best_k]['inertia'], 3)}",
+            label=f"elbow at k = {best_k}, score = {round(inertias[best_index], 3)}",
         )
         plt.legend(loc="upper right", frameon=True, framealpha=1)
         plt.show()
@@ -169,8 +193,11 @@ class AutoKMeansText(AutoKMeans):
         return self.kmeans.predict(embedded_text, sample_weight)
 
     def _embed_data(self, text_data):
-        return self.embed_model.encode(
-            text_data,
-            convert_to_tensor=True,
-            normalize_embeddings=True,
-        )
+        # Unlike `no_grad`, used by `encode`, `inference_mode` also skips the
+        # tensors' version tracking
+        with torch.inference_mode():
+            return self.embed_model.encode(
+                text_data,
+                convert_to_tensor=True,
+                normalize_embeddings=True,
+            )
@@ -3,9 +3,12 @@ import numpy as np
 import torch
 from loguru import logger
 from numpy.typing import ArrayLike
+from scipy import sparse
 from scipy.sparse import csgraph
-from scipy.spatial.distance import pdist, squareform
+from scipy.sparse.linalg import LinearOperator, eigsh
 from sklearn.cluster import SpectralClustering
+from sklearn.metrics.pairwise import pairwise_kernels
+from sklearn.neighbors import kneighbors_graph
 
 from tidder.dependencies import pyplot as plt
 
@@ -48,11 +51,14 @@ class AutoSpectralClustering(SpectralClustering):
         by the clustering algorithm.
     random_state : int, default 42
         Random state.
+    max_n_clusters : int, default 20
+        Maximum number of clusters considered when selecting the number of clusters.
     """
 
     affinity: str = attrs.field(default="rbf", kw_only=True)
     random_state: int = attrs.field(default=42, kw_only=True)
     plot: bool = attrs.field(default=False, kw_only=True)
+    max_n_clusters: int = attrs.field(default=20, kw_only=True)
 
     internal_affinity: str = attrs.field(
         default=None, init=False, repr=False, kw_only=True
@@ -77,28 +83,30 @@ class AutoSpectralClustering(SpectralClustering):
 
         Credit to ciortanmadalina@github
         """
-        # Calculate euclidian distance matrix
-        dists = squareform(pdist(embedded_data.numpy()))
+        # Everything is computed on the embeddings' device, e.g. the GPU, and only
+        # the resulting affinity matrix is copied back to the CPU. Float32 halves the
+        # memory traffic over the N x N matrices, compared to float64.
+        embedded_data = embedded_data.detach().to(torch.float32)
 
-        # For each row, sort the distances ascendingly and take the index of the
-        # k-th position (nearest neighbour)
-        knn_distances = np.sort(dists, axis=0)[k]
-        knn_distances = knn_distances[np.newaxis].T
+        # Calculate squared euclidian distance matrix, only the k-th nearest
+        # neighbours' distances need the square root. `cdist` computes it with matrix
+        # products, straight into the full matrix.
+        affinity_matrix = torch.cdist(embedded_data, embedded_data).square_()
 
-        # Calculate sigma_i * sigma_j
-        local_scale = knn_distances.dot(knn_distances.T)
+        # For each row, select the distance at the k-th position (nearest neighbour),
+        # there's no need to fully sort them
+        knn_distances = affinity_matrix.kthvalue(k + 1, dim=0).values.sqrt_()
 
-        affinity_matrix = dists * dists
-        affinity_matrix = -affinity_matrix / local_scale
-
-        # Divide square distance matrix by local scale
-        affinity_matrix[np.where(np.isnan(affinity_matrix))] = 0.0
+        # Divide square distance matrix by local scale sigma_i * sigma_j, in place
+        affinity_matrix.div_(knn_distances[:, None]).div_(knn_distances[None, :])
+        affinity_matrix.neg_()
+        affinity_matrix.masked_fill_(affinity_matrix.isnan(), 0.0)
 
         # Apply exponential
-        affinity_matrix = np.exp(affinity_matrix)
-        np.fill_diagonal(affinity_matrix, 0)
+        affinity_matrix.exp_()
+        affinity_matrix.fill_diagonal_(0)
 
-        return affinity_matrix
+        return affinity_matrix.cpu().numpy()
 
     def __attrs_post_init__(self):
         # Placeholder value for n_clusters, will be set in `fit`
@@ -130,16 +138,24 @@ class AutoSpectralClustering(SpectralClustering):
         ):
             self.internal_affinity_matrix = self.embedded_data
 
+        # Build the affinity matrix as `SpectralClustering.fit` does, without fitting
+        # a throwaway model for it
         if self.internal_affinity_matrix is None:
-            model = SpectralClustering(
-                # Set a dummy value to the number of clusters.
-                affinity=self.affinity,
-                random_state=self.random_state,
-            )
-
-            model.fit(self.embedded_data)
-
-            self.internal_affinity_matrix = model.affinity_matrix_
+            if self.affinity == "nearest_neighbors":
+                connectivity = kneighbors_graph(
+                    self.embedded_data, n_neighbors=self.n_neighbors, include_self=True
+                )
+                self.internal_affinity_matrix = 0.5 * (connectivity + connectivity.T)
+            else:
+                params = dict(self.kernel_params or {})
+                if not callable(self.affinity):
+                    params.update(gamma=self.gamma, degree=self.degree, coef0=self.coef0)
+                self.internal_affinity_matrix = pairwise_kernels(
+                    self.embedded_data,
+                    metric=self.affinity,
+                    filter_params=True,
+                    **params,
+                )
 
         if self.affinity == "nearest_neighbors":
             self.internal_affinity = "precomputed_nearest_neighbors"
@@ -155,14 +171,34 @@ class AutoSpectralClustering(SpectralClustering):
         laplacian_affinity_matrix = csgraph.laplacian(
             self.internal_affinity_matrix, normed=True
         )
-        n_components = self.internal_affinity_matrix.shape[0]  # noqa: F841
-
-        # LM parameter : Eigenvalues with largest magnitude (eigs, eigsh), that is, largest eigenvalues in
-        # the euclidean norm of complex numbers.
-        # eigenvalues, eigenvectors = eigsh(
-        #     L, k=n_components, which="LM", sigma=1.0, maxiter=5000
-        # )
-        eigenvalues, eigenvectors = np.linalg.eig(laplacian_affinity_matrix)
+        n_components = laplacian_affinity_matrix.shape[0]
+
+        # Only the smallest eigenvalues are needed to select up to `max_n_clusters`
+        n_eigenvalues = min(self.max_n_clusters + 1, n_components - 1)
+        if n_components < 50:
+            # The full decomposition is cheaper than Lanczos' overhead on tiny inputs
+            if sparse.issparse(laplacian_affinity_matrix):
+                laplacian_affinity_matrix = laplacian_affinity_matrix.toarray()
+            # The eigenvectors are not used, and `eigvalsh` returns the eigenvalues
+            # sorted ascendingly
+            eigenvalues = np.linalg.eigvalsh(laplacian_affinity_matrix)[:n_eigenvalues]
+        else:
+            # The normalized laplacian's eigenvalues lie in [0, 2], so its smallest
+            # eigenvalues are the largest of I - L, which Lanczos iterations find
+            # with matrix-vector products alone, without factorizing the laplacian.
+            shifted_laplacian = LinearOperator(
+                laplacian_affinity_matrix.shape,
+                matvec=lambda v: v - laplacian_affinity_matrix @ v,
+                dtype=laplacian_affinity_matrix.dtype,
+            )
+            eigenvalues = eigsh(
+                shifted_laplacian,
+                k=n_eigenvalues,
+                which="LA",
+                tol=1e-4,
+                return_eigenvectors=False,
+            )
+            eigenvalues = np.sort(1 - eigenvalues)
 
         # Remove first eigenvalue, as it represents only one cluster
         eigenvalues = eigenvalues[1:]
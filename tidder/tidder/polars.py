@@ -44,13 +44,68 @@ def time_based_replace(
         A polars expression that performs conditional replacement into a new
         column.
     """
-    # Hack beginning of expression
-    expr = pl
-    for info in info_dicts:
-        expr = expr.when(
-            (pl.col(df_start_column) >= info[info_start_column])
-            & (pl.col(df_end_column) <= info[info_end_column])
-        ).then(pl.lit(info[info_value_column]))
+    if not info_dicts:
+        return pl.lit(default_value).alias(taget_column)
+
+    starts = pl.Series([info[info_start_column] for info in info_dicts])
+    ends = pl.Series([info[info_end_column] for info in info_dicts])
+
+    # Unordered, or overlapping, time spans must be matched in the given order, one
+    # after the other
+    if not ends.is_sorted() or (ends.head(-1) > starts.tail(-1)).any():
+        return _chained_time_based_replace(
+            info_dicts,
+            taget_column,
+            info_value_column,
+            default_value,
+            df_start_column,
+            df_end_column,
+            info_start_column,
+            info_end_column,
+            fill_strategy,
+        )
+
+    # Ordered, non overlapping, time spans are matched by binary search. The only time
+    # span that may contain a row is the first one ending after the row ends.
+    index = (
+        pl.lit(ends)
+        .search_sorted(pl.col(df_end_column), side="left")
+        .clip(upper_bound=ends.len() - 1)
+    )
+    values = pl.Series([info[info_value_column] for info in info_dicts])
+    expr = pl.when(
+        (pl.col(df_start_column) >= pl.lit(starts).gather(index))
+        & (pl.col(df_end_column) <= pl.lit(ends).gather(index))
+    ).then(pl.lit(values).gather(index))
+
+    if default_value is not None:
+        expr = expr.otherwise(default_value)
+
+    return expr.fill_null(strategy=fill_strategy).alias(taget_column)
+
+
+def _chained_time_based_replace(
+    info_dicts: list[TimeBasedInfo],
+    taget_column: str,
+    info_value_column: str,
+    default_value: str | None,
+    df_start_column: str,
+    df_end_column: str,
+    info_start_column: str,
+    info_end_column: str,
+    fill_strategy: str | None,
+) -> pl.Expr:
+    """Map start and end times to values, checking time spans one by one."""
+
+    def is_within(info: TimeBasedInfo) -> pl.Expr:
+        return (pl.col(df_start_column) >= info[info_start_column]) & (
+            pl.col(df_end_column) <= info[info_end_column]
+        )
+
+    first_info, *other_infos = info_dicts
+    expr = pl.when(is_within(first_info)).then(pl.lit(first_info[info_value_column]))
+    for info in other_infos:
+        expr = expr.when(is_within(info)).then(pl.lit(info[info_value_column]))
 
     if default_value is not None:
         expr = expr.otherwise(default_value)
@@ -20,9 +20,18 @@ class ColumnTransformer(TransformerMixin):
     def __init__(self, transformer: TransformerMixin, ignore_columns: List[str]):
         self._transformer = transformer
         self._ignore_columns = ignore_columns
+        self._columns: Optional[pd.Index] = None
+        self._filtered_columns: Optional[pd.Index] = None
 
     def _get_filtered_columns(self, columns: pd.Index):
-        return columns.difference(self._ignore_columns)
+        # Inputs usually share their columns between calls, reuse the last result
+        if self._columns is None or not (
+            columns is self._columns or columns.equals(self._columns)
+        ):
+            self._columns = columns
+            self._filtered_columns = columns.difference(self._ignore_columns)
+
+        return self._filtered_columns
 
     def fit(self, X: pd.DataFrame, y: Optional[Iterable] = None):
         filtered_columns = self._get_filtered_columns(X.columns)
@@ -30,8 +39,9 @@ class ColumnTransformer(TransformerMixin):
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        # Copy input to not overwrite it
-        X = X.copy()
+        # Copy input to not overwrite it. A shallow copy is enough, since the filtered
+        # columns are replaced rather than written into.
+        X = X.copy(deep=False)
 
         filtered_columns = self._get_filtered_columns(X.columns)
         X[filtered_columns] = self._transformer.transform(X[filtered_columns])
@@ -39,8 +49,8 @@ class ColumnTransformer(TransformerMixin):
         return X
 
     def inverse_transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        # Copy input to not overwrite it
-        X = X.copy()
+        # Copy input to not overwrite it, see `transform`
+        X = X.copy(deep=False)
 
         filtered_columns = self._get_filtered_columns(X.columns)
         X[filtered_columns] = self._transformer.inverse_transform(X[filtered_columns])
@@ -0,0 +1,75 @@
+from typing import Literal
+
+import attrs
+import numpy as np
+import pandas as pd
+import torch
+from loguru import logger
+from sentence_transformers import SentenceTransformer
+from sklearn.base import BaseEstimator, TransformerMixin
+
+# Loaded models, by name and precision. Pipeline steps only hold these keys, so
+# that cloning and hashing them, e.g. for a pipeline's cache, stays cheap.
+_SENTENCE_TRANSFORMERS: dict[tuple[str, str], SentenceTransformer] = {}
+
+
+def load_sentence_transformer(
+    model_name: str, precision: Literal["fp32", "fp16"] = "fp32", **kwargs
+) -> SentenceTransformer:
+    """Load a `SentenceTransformer`, once per name and precision.
+
+    Keyword arguments, e.g. the `device`, are passed to `SentenceTransformer` the
+    first time the model is loaded. By default, it runs on GPU whenever one is
+    available, be it CUDA or Apple's MPS.
+
+    Parameters
+    ----------
+    model_name: str
+        Name or path of the SentenceTransformer model.
+    precision: {"fp32", "fp16"}, default "fp32"
+        Precision of the model's weights. Half precision is only used on GPU,
+        where it roughly doubles the embedding throughput.
+    """
+    key = (model_name, precision)
+    if key not in _SENTENCE_TRANSFORMERS:
+        # SentenceTransformer only picks CUDA devices by itself
+        if "device" not in kwargs and torch.backends.mps.is_available():
+            kwargs["device"] = "mps"
+        model = SentenceTransformer(model_name, **kwargs)
+        if precision == "fp16":
+            if model.device.type == "cuda":
+                model.half()
+            else:
+                logger.warning("fp16 precision is only supported on GPU, using fp32.")
+        _SENTENCE_TRANSFORMERS[key] = model
+    return _SENTENCE_TRANSFORMERS[key]
+
+
+@attrs.define
+class SentenceEmbedder(BaseEstimator, TransformerMixin):
+    """Embed sentences with a `SentenceTransformer`, as a pipeline step.
+
+    The model is referred to by name and precision, see `load_sentence_transformer`.
+    """
+
+    model_name: str
+    precision: Literal["fp32", "fp16"] = "fp32"
+
+    @property
+    def model(self) -> SentenceTransformer:
+        return load_sentence_transformer(self.model_name, self.precision)
+
+    def transform(self, X):
+        # Repeated sentences are only embedded once
+        inverse, sentences = pd.factorize(np.asarray(X, dtype=object))
+        # Missing sentences are marked with -1, which would pick the last embedding
+        if (inverse == -1).any():
+            raise ValueError("Sentences to embed must not be missing.")
+        with torch.inference_mode():
+            embeddings = self.model.encode(
+                sentences.tolist(), convert_to_numpy=True, normalize_embeddings=True
+            )
+        return embeddings[inverse]
+
+    def fit(self, X, y=None, **fit_params):
+        return self
@@ -1,12 +1,28 @@
-from functools import partial
+from itertools import chain
 from typing import Iterable, List, Optional
 
 import attrs
+import numpy as np
 import pandas as pd
 import spacy
+from spacy.attrs import IS_STOP, LEMMA, ORTH
 
 from .base import Transformer
 
+# Components of Spacy's pipeline not needed for tokenization
+_DISABLED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "ner"]
+
+
+def _load_transformer_pipeline() -> spacy.language.Language:
+    """Load Spacy's transformer pipeline, on GPU with mixed precision if available."""
+    if spacy.prefer_gpu():
+        return spacy.load(
+            "en_core_web_trf",
+            config={"components.transformer.model.mixed_precision": True},
+        )
+
+    return spacy.load("en_core_web_trf")
+
 
 @attrs.define
 class DummySentenceTokenizer(Transformer):
@@ -36,11 +52,22 @@ class DummySentenceTokenizer(Transformer):
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Split text into sentences."""
-        X[self.output_column] = X[self.input_column].apply(lambda t: t.split(self.split_token))
+        X[self.output_column] = X[self.input_column].str.split(
+            self.split_token, regex=False
+        )
 
         if self.explode:
-            X = X.explode(self.output_column)
-            X.reset_index(names=self.original_index_column, inplace=True)
+            # Repeat each row once per sentence with a single take, instead of
+            # `explode`, which joins the exploded column back on a repeated index
+            sentences = X[self.output_column].to_numpy()
+            n_sentences = np.fromiter(map(len, sentences), dtype=np.intp)
+            rows = np.repeat(np.arange(len(X)), n_sentences)
+
+            original_index = X.index[rows]
+            X = X.take(rows)
+            X[self.output_column] = list(chain.from_iterable(sentences))
+            X.index = pd.RangeIndex(len(X))
+            X.insert(0, self.original_index_column, original_index)
 
         return X
 
@@ -62,28 +89,52 @@ class SpacyTokenizer(Transformer):
     output_column : str, default to "tokens"
         Name of column to hold the output from Spacy's pipeline.
     nlp_pipeline : `spacy.language.Language`
-        Spacy's pipeline.
+        Spacy's pipeline. By default, `en_core_web_trf`, on GPU with mixed precision
+        when one is available.
     remove_stopwords : bool
         Whether to remove stopwords or not.
     extra_stopwords : list of str
         Extra stop words.
+    batch_size : int, default to 64
+        Number of texts processed at once by Spacy's pipeline.
+    n_process : int, default to 1
+        Number of processes running Spacy's pipeline. -1 means using all
+        processors. Keep a single process when running the pipeline on GPU.
     """
 
     input_column: str
     output_column: str = attrs.field(default="tokens")
     nlp_pipeline: spacy.language.Language = attrs.field(
-        factory=partial(spacy.load, "en_core_web_trf")
+        factory=_load_transformer_pipeline
     )
     clean_tokens: bool = attrs.field(default=True)
     remove_stopwords: bool = attrs.field(default=True)
     extra_stopwords: List[str] = attrs.field(factory=list)
+    batch_size: int = attrs.field(default=64)
+    n_process: int = attrs.field(default=1)
+
+    # Set version of `extra_stopwords`, for constant time membership tests
+    _extra_stopwords_set: frozenset[str] = attrs.field(
+        default=attrs.Factory(
+            lambda self: frozenset(self.extra_stopwords), takes_self=True
+        ),
+        init=False,
+        repr=False,
+    )
 
     def fit(self, X: pd.DataFrame, y: Optional[Iterable] = None):
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Apply tokenization."""
-        X[self.output_column] = X[self.input_column].apply(self._tokenize)
+        # Texts go through Spacy's pipeline in batches, instead of one at a time
+        docs = self.nlp_pipeline.pipe(
+            X[self.input_column],
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+            disable=_DISABLED_COMPONENTS,
+        )
+        X[self.output_column] = [self._tokenize(doc) for doc in docs]
         return X
 
     def inverse_transform(self, X: pd.DataFrame) -> pd.DataFrame:
@@ -91,27 +142,28 @@ class SpacyTokenizer(Transformer):
         X.drop(columns=self.output_column, inplace=True)
         return X
 
-    def _tokenize(self, text) -> List[str]:
-        """Tokenize text."""
-        tokens = []
-        for tok in self.nlp_pipeline(
-            text,
-            disable=[
-                "tagger",
-                "parser",
-                "attribute_ruler",
-                "ner",
-            ],
-        ):
-            clean_token = tok.text
-            if self.clean_tokens:
-                clean_token = tok.lemma_.lower()
-            if not self.remove_stopwords or (
-                not tok.is_stop and clean_token not in self.extra_stopwords
-            ):
-                tokens.append(clean_token)
-
-        return tokens
+    def _tokenize(self, doc: spacy.tokens.Doc) -> List[str]:
+        """Tokenize text processed by Spacy's pipeline."""
+        return self._clean_tokens(doc)
+
+    def _clean_tokens(self, tokens: spacy.tokens.Doc | spacy.tokens.Span) -> List[str]:
+        """Clean, and filter out stopwords from, the tokens of a doc or span."""
+        # Export the tokens' attributes at once, instead of reading them token by token
+        text_attr = LEMMA if self.clean_tokens else ORTH
+        texts, is_stops = tokens.to_array([text_attr, IS_STOP]).T.tolist()
+
+        clean_tokens = [tokens.vocab.strings[text] for text in texts]
+        if self.clean_tokens:
+            clean_tokens = [clean_token.lower() for clean_token in clean_tokens]
+
+        if not self.remove_stopwords:
+            return clean_tokens
+
+        return [
+            clean_token
+            for clean_token, is_stop in zip(clean_tokens, is_stops)
+            if not is_stop and clean_token not in self._extra_stopwords_set
+        ]
 
 
 @attrs.define
@@ -131,34 +183,15 @@ class SpacySentenceTokenizer(SpacyTokenizer):
         Whether to remove stopwords or not.
     extra_stopwords : list of str
         Extra stop words.
+    batch_size : int, default to 64
+        Number of texts processed at once by Spacy's pipeline.
+    n_process : int, default to 1
+        Number of processes running Spacy's pipeline.
     """
 
     def __attrs_post_init__(self):
         self.nlp_pipeline.add_pipe("sentencizer")
 
-    def _tokenize(self, text) -> List[str]:
-        """Tokenize text."""
-        doc = self.nlp_pipeline(
-            text,
-            disable=[
-                "tagger",
-                "parser",
-                "attribute_ruler",
-                "ner",
-            ],
-        )
-
-        sentences = []
-        for sent in doc.sents:
-            tokens = []
-            for tok in sent:
-                clean_token = tok.text
-                if self.clean_tokens:
-                    clean_token = tok.lemma_.lower()
-                if not self.remove_stopwords or (
-                    not tok.is_stop and clean_token not in self.extra_stopwords
-                ):
-                    tokens.append(clean_token)
-            sentences.append(tokens)
-
-        return sentences
+    def _tokenize(self, doc: spacy.tokens.Doc) -> List[str]:
+        """Tokenize text processed by Spacy's pipeline."""
+        return [self._clean_tokens(sent) for sent in doc.sents]